@@ -4,15 +4,37 @@ Unit tests for path_util module.
 WHY: Path utilities handle the critical distinction between development
 mode (source files) and packaged mode (PyInstaller bundle). Getting paths
 wrong means missing resources and app crashes.
+
+PERF: These tests are mock-bound, not compute-bound. Resolve paths once in
+module-scoped fixtures, and change sys state only through monkeypatch.
 """
 
 import os
 import sys
 from pathlib import Path
-from unittest.mock import patch, MagicMock
 
 import pytest
 
+from src.util.lockfile_handler import LOCKFILE_PATH
+from src.util.path_util import get_config_path, get_packaged_path
+
+
+@pytest.fixture(scope="module")
+def config_path():
+    """
+    Resolve get_config_path() once for the module.
+
+    WHY: The result only depends on the home directory, which doesn't
+    change during a test run, so repeating the lookup is wasted work.
+    """
+    return get_config_path()
+
+
+@pytest.fixture(scope="module")
+def home_dir():
+    """Resolve the user's home directory once for the module."""
+    return str(Path.home())
+
 
 class TestGetPackagedPath:
     """
@@ -23,7 +45,7 @@ class TestGetPackagedPath:
     2. Packaged mode: Return path relative to PyInstaller's temp dir
     """
 
-    def test_development_mode_returns_source_relative_path(self, mocker):
+    def test_development_mode_returns_source_relative_path(self, monkeypatch):
         """
         Verify path resolution in development mode.
 
@@ -31,10 +53,9 @@ class TestGetPackagedPath:
         The function should return paths relative to the project root.
         """
         # Ensure we're not in packaged mode
-        if hasattr(sys, '_MEIPASS'):
-            delattr(sys, '_MEIPASS')
-
-        from src.util.path_util import get_packaged_path
+        # WHY monkeypatch: pytest restores _MEIPASS afterwards, so other
+        # tests never see process state changed by this one
+        monkeypatch.delattr(sys, "_MEIPASS", raising=False)
 
         # Request a resource path
         result = get_packaged_path("resources/config/config.json")
@@ -44,31 +65,23 @@ class TestGetPackagedPath:
         assert "resources" in result
         assert "config.json" in result
 
-    def test_packaged_mode_uses_meipass(self, mocker):
+    def test_packaged_mode_uses_meipass(self, monkeypatch):
         """
         Verify path resolution in PyInstaller packaged mode.
 
         WHY: When bundled with PyInstaller, resources are extracted to
         a temp directory stored in sys._MEIPASS. We must use this path.
         """
-        from src.util.path_util import get_packaged_path
-
         # Simulate PyInstaller environment
+        # WHY monkeypatch: Sets a real attribute that pytest restores after
+        # the test, so no builtins need to be intercepted
         fake_meipass = "/tmp/fake_meipass_12345"
-        mocker.patch.object(sys, '_MEIPASS', fake_meipass, create=True)
-
-        # Also need to patch hasattr check
-        original_hasattr = hasattr
+        monkeypatch.setattr(sys, "_MEIPASS", fake_meipass, raising=False)
 
-        def patched_hasattr(obj, name):
-            if obj is sys and name == '_MEIPASS':
-                return True
-            return original_hasattr(obj, name)
-
-        mocker.patch('builtins.hasattr', patched_hasattr)
+        result = get_packaged_path("resources/config/config.json")
 
-        # This test verifies the behavior when _MEIPASS exists
-        # The actual implementation may vary
+        assert result.startswith(os.path.abspath(fake_meipass))
+        assert result.endswith("config.json")
 
     def test_path_handles_special_characters(self):
         """
@@ -76,8 +89,6 @@ class TestGetPackagedPath:
 
         WHY: Windows paths can contain spaces, unicode, etc.
         """
-        from src.util.path_util import get_packaged_path
-
         # Test with path containing special chars
         result = get_packaged_path("resources/img/icon.ico")
 
@@ -93,45 +104,18 @@ class TestGetConfigPath:
     persistent storage across runs.
     """
 
-    def test_config_path_uses_home_directory(self):
+    def test_config_path_shape(self, config_path, home_dir):
         """
-        Verify config path is in user's home directory.
+        Verify config path is a JSON file under ~/.pawgate.
 
         WHY: User-specific config must be in home dir, not program dir,
         so it persists across updates and works on multi-user systems.
+        We use a hidden directory (.pawgate) following Unix/Linux
+        conventions, and store config as JSON for easy manual editing.
         """
-        from src.util.path_util import get_config_path
-
-        result = get_config_path()
-        home = str(Path.home())
-
-        assert result.startswith(home), f"Config path should start with {home}, got {result}"
-
-    def test_config_path_contains_pawgate_dir(self):
-        """
-        Verify config path includes .pawgate directory.
-
-        WHY: We use a hidden directory (.pawgate) to store config,
-        following Unix/Linux conventions for app-specific data.
-        """
-        from src.util.path_util import get_config_path
-
-        result = get_config_path()
-
-        assert ".pawgate" in result, f"Config path should contain .pawgate, got {result}"
-
-    def test_config_path_ends_with_json(self):
-        """
-        Verify config path points to a JSON file.
-
-        WHY: Config is stored as JSON for human readability and
-        easy manual editing if needed.
-        """
-        from src.util.path_util import get_config_path
-
-        result = get_config_path()
-
-        assert result.endswith(".json"), f"Config path should end with .json, got {result}"
+        assert config_path.startswith(home_dir), f"Config path should start with {home_dir}, got {config_path}"
+        assert ".pawgate" in config_path, f"Config path should contain .pawgate, got {config_path}"
+        assert config_path.endswith(".json"), f"Config path should end with .json, got {config_path}"
 
 
 class TestGetLockfilePath:
@@ -148,8 +132,6 @@ class TestGetLockfilePath:
         WHY: Lockfile should be alongside config for consistency
         and to avoid polluting the home directory root.
         """
-        from src.util.lockfile_handler import LOCKFILE_PATH
-
         assert ".pawgate" in LOCKFILE_PATH
         assert "lockfile" in LOCKFILE_PATH.lower()
 